@@ -132,7 +132,8 @@ class DataExtractionGUI(QMainWindow):
         self.papers: Dict[str, Dict[str, str]] = {}
         self.paper_keys: List[str] = []  # Ordered list of paper keys
         self.current_paper_index: int = 0  # Index of current paper being worked on
-        self.selected_values: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+        # Selected options per attribute, kept as an insertion-ordered set (dict keys)
+        self.selected_values: Dict[str, Dict[str, Dict[str, Dict[str, None]]]] = {}
         self.selected_Other_text: Dict[str, Dict[str, Dict[str, str]]] = {}
         self.checkboxes: Dict[str, QCheckBox] = {}
         self.text_inputs: Dict[str, QLineEdit] = {}
@@ -639,7 +640,7 @@ class DataExtractionGUI(QMainWindow):
 
             for attribute, selections in responses[question_key].items():
                 if attribute not in self.selected_values[entry_key][question_key]:
-                    self.selected_values[entry_key][question_key][attribute] = []
+                    self.selected_values[entry_key][question_key][attribute] = {}
                     self.selected_Other_text[entry_key][question_key][attribute] = ""
 
                 # Parse selections and reconstruct them
@@ -647,12 +648,12 @@ class DataExtractionGUI(QMainWindow):
                     if selection.startswith("Other: "):
                         # Extract "Other" text
                         Other_text = selection[7:]  # Remove "Other: " prefix
-                        self.selected_values[entry_key][question_key][attribute].append("Other")
+                        self.selected_values[entry_key][question_key][attribute]["Other"] = None
                         self.selected_Other_text[entry_key][question_key][attribute] = Other_text
                     elif selection.startswith("Discussion needed: "):
                         # Extract discussion text
                         discussion_text = selection[19:]  # Remove "Discussion needed: " prefix
-                        self.selected_values[entry_key][question_key][attribute].append("Discussion needed")
+                        self.selected_values[entry_key][question_key][attribute]["Discussion needed"] = None
                         discussion_key = f"{entry_key}_{question_key}_{attribute}_discussion"
                         # Store in a temp structure (will be set when widgets are created)
                         if attribute not in self.selected_Other_text[entry_key][question_key]:
@@ -662,7 +663,7 @@ class DataExtractionGUI(QMainWindow):
                             self._discussion_texts = {}
                         self._discussion_texts[discussion_key] = discussion_text
                     else:
-                        self.selected_values[entry_key][question_key][attribute].append(selection)
+                        self.selected_values[entry_key][question_key][attribute][selection] = None
 
     def _save_session_state(self) -> None:
         """Save the current session state to allow resuming incomplete work."""
@@ -752,7 +753,7 @@ class DataExtractionGUI(QMainWindow):
             # Check each attribute (category) in the question
             for attribute in options_dict.keys():
                 # Get selections for this attribute
-                selections = self.selected_values[entry_key].get(question_key, {}).get(attribute, [])
+                selections = self.selected_values[entry_key].get(question_key, {}).get(attribute, {})
 
                 # Check if at least one item is selected
                 if not selections:
@@ -820,7 +821,7 @@ class DataExtractionGUI(QMainWindow):
         for attribute, options in options_dict.items():
             # Initialize tracking for this attribute
             if attribute not in self.selected_values[entry_key][question_key]:
-                self.selected_values[entry_key][question_key][attribute] = []
+                self.selected_values[entry_key][question_key][attribute] = {}
                 self.selected_Other_text[entry_key][question_key][attribute] = ""
             
             # Initialize toggle state for this attribute if needed
@@ -984,7 +985,7 @@ class DataExtractionGUI(QMainWindow):
             group_key = f"{entry_key}_{question_key}_{attribute}"
             if group_key in self.radio_button_groups and selections:
                 # For radio buttons, only the last selection is active
-                selection = selections[0]
+                selection = next(iter(selections))
                 radio_key = f"{entry_key}_{question_key}_{attribute}_{selection}"
                 if radio_key in self.radio_buttons:
                     self.radio_buttons[radio_key].setChecked(True)
@@ -993,7 +994,7 @@ class DataExtractionGUI(QMainWindow):
             combo_key = f"{entry_key}_{question_key}_{attribute}"
             if combo_key in self.comboboxes and selections:
                 combo = self.comboboxes[combo_key]
-                combo.setCurrentText(selections[0])
+                combo.setCurrentText(next(iter(selections)))
 
             # Restore "Other" text if present
             if "Other" in selections:
@@ -1173,7 +1174,7 @@ class DataExtractionGUI(QMainWindow):
         if question_key not in self.selected_values[entry_key]:
             self.selected_values[entry_key][question_key] = {}
         if attribute not in self.selected_values[entry_key][question_key]:
-            self.selected_values[entry_key][question_key][attribute] = []
+            self.selected_values[entry_key][question_key][attribute] = {}
         
         # Check if already selected
         if selected_text in self.selected_values[entry_key][question_key][attribute]:
@@ -1181,7 +1182,7 @@ class DataExtractionGUI(QMainWindow):
             return
         
         # Add the value
-        self.selected_values[entry_key][question_key][attribute].append(selected_text)
+        self.selected_values[entry_key][question_key][attribute][selected_text] = None
         
         # Update the UI to show selected values
         self._update_multiple_selection_display(entry_key, question_key, attribute)
@@ -1216,7 +1217,7 @@ class DataExtractionGUI(QMainWindow):
                     self._clear_layout(item.layout())
         
         # Get current selections
-        selections = self.selected_values.get(entry_key, {}).get(question_key, {}).get(attribute, [])
+        selections = self.selected_values.get(entry_key, {}).get(question_key, {}).get(attribute, {})
         
         if not selections:
             empty_label = QLabel("No values selected yet")
@@ -1281,7 +1282,7 @@ class DataExtractionGUI(QMainWindow):
             attribute in self.selected_values[entry_key][question_key] and
             value in self.selected_values[entry_key][question_key][attribute]):
             
-            self.selected_values[entry_key][question_key][attribute].remove(value)
+            del self.selected_values[entry_key][question_key][attribute][value]
             self._update_multiple_selection_display(entry_key, question_key, attribute)
 
     def _create_radio_buttons(self, layout: QVBoxLayout, entry_key: str, question_key: str,
@@ -1409,11 +1410,9 @@ class DataExtractionGUI(QMainWindow):
         """
         # Update selected values (state 2 = checked, 0 = unchecked)
         if state == 2:
-            if option not in self.selected_values[entry_key][question_key][attribute]:
-                self.selected_values[entry_key][question_key][attribute].append(option)
+            self.selected_values[entry_key][question_key][attribute][option] = None
         else:
-            if option in self.selected_values[entry_key][question_key][attribute]:
-                self.selected_values[entry_key][question_key][attribute].remove(option)
+            self.selected_values[entry_key][question_key][attribute].pop(option, None)
 
         # Enable/disable text input for "Other" option
         if option == "Other":
@@ -1460,7 +1459,7 @@ class DataExtractionGUI(QMainWindow):
         """
         if checked:
             # For single-choice, replace the entire selection list with just this option
-            self.selected_values[entry_key][question_key][attribute] = [option]
+            self.selected_values[entry_key][question_key][attribute] = {option: None}
             
             # Enable/disable text input for "Other" option
             text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
@@ -1504,7 +1503,7 @@ class DataExtractionGUI(QMainWindow):
         """
         if text and text != "-- Select an option --":
             # Replace selection with the chosen option
-            self.selected_values[entry_key][question_key][attribute] = [text]
+            self.selected_values[entry_key][question_key][attribute] = {text: None}
             
             # Enable/disable text input for "Other" option
             text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
@@ -1538,7 +1537,7 @@ class DataExtractionGUI(QMainWindow):
                     self.discussion_text_inputs[discussion_key].clear()
         else:
             # Clear selection if placeholder is selected
-            self.selected_values[entry_key][question_key][attribute] = []
+            self.selected_values[entry_key][question_key][attribute] = {}
             
             # Disable text input for "Other" option
             text_input_key = f"{entry_key}_{question_key}_{attribute}_Other"
@@ -1720,7 +1719,7 @@ class DataExtractionGUI(QMainWindow):
                 for question_key in self.selected_values[entry_key]:
                     output[entry_key]['responses'][question_key] = {}
                     for attribute in self.selected_values[entry_key][question_key]:
-                        selections = self.selected_values[entry_key][question_key][attribute].copy()
+                        selections = list(self.selected_values[entry_key][question_key][attribute])
                         
                         # Handle "Other" option
                         if "Other" in selections and self.selected_Other_text[entry_key][question_key][attribute]:
@@ -1765,7 +1764,7 @@ class DataExtractionGUI(QMainWindow):
         for entry_key in self.selected_values:
             for question_key in self.selected_values[entry_key]:
                 for attribute in self.selected_values[entry_key][question_key]:
-                    self.selected_values[entry_key][question_key][attribute] = []
+                    self.selected_values[entry_key][question_key][attribute] = {}
                     self.selected_Other_text[entry_key][question_key][attribute] = ""
 
         for checkbox in self.checkboxes.values():
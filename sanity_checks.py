@@ -17,31 +17,90 @@ Supported operators in `when`: equals (string or boolean).
 Supported assertions in `then`: must_equal (string), must_not_equal (string).
 
 The validator is intentionally small and dependency-free so it can be shipped
-without extra packages.
+without extra packages. If `orjson` happens to be installed it is used to parse
+the JSON files; otherwise the stdlib `json` module is used.
 """
 
 from __future__ import annotations
 
+import functools
 import json
-from typing import Dict, List, Any, Optional
+import os
+import re
+from collections import namedtuple
+from typing import Dict, FrozenSet, Iterable, List, Any, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Sentinel for operator keys that are absent from a rule's `when`/`then` block.
+_MISSING = object()
+
+# Normalized forms of a response value list: (whole values, "Prefix: ..." prefixes).
+NormIndex = Tuple[FrozenSet[str], FrozenSet[str]]
+NormCache = Dict[Tuple[str, str], NormIndex]
+
+# (source, question, attribute) of a field a rule reads.
+FieldKey = Tuple[str, str, str]
+
+# Compiled rules as parallel columns indexed by rule id, plus the ids bucketed by
+# the field that triggers them (`by_trigger`) and the ids of rules that can fire
+# even when their field is absent from the paper (`untriggered`). Expected values
+# for response fields are pre-normalized strings, or raw values for non-strings.
+CompiledRules = namedtuple('CompiledRules', [
+    'by_trigger', 'untriggered',
+    'trigger_keys', 'trigger_expected', 'target_keys', 'target_expected', 'negate', 'messages',
+])
+
+_NO_RULES = CompiledRules({}, (), (), (), (), (), (), ())
 
 
 def _load_config(config_path: str) -> List[Dict[str, Any]]:
-    try:
-        with open(config_path, 'r') as f:
-            data = json.load(f)
-            # Accept either a dict with 'rules' key or a raw list
-            if isinstance(data, dict) and 'rules' in data:
-                return data['rules']
-            if isinstance(data, list):
-                return data
-    except Exception:
-        return []
+    """Read the rule list from config_path.
+
+    Raises OSError or ValueError when the file cannot be read or parsed.
+    """
+    with open(config_path, 'rb') as f:
+        data = _loads(f.read())
+    # Accept either a dict with 'rules' key or a raw list
+    if isinstance(data, dict) and 'rules' in data:
+        return data['rules']
+    if isinstance(data, list):
+        return data
     return []
 
 
-def _get_response_values(paper_entry: Dict[str, Any], question: str, attribute: str) -> List[str]:
-    responses = paper_entry.get('responses', {})
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> CompiledRules:
+    """Load and compile the rules in config_path.
+
+    `mtime_ns` and `size` are only part of the cache key: editing the config file
+    changes them and forces a reload on the next call.
+    """
+    return _compile_rules(_load_config(config_path))
+
+
+def load_rules(config_path: str = 'sanity_checks.json') -> CompiledRules:
+    """Load and compile the rules in config_path for use with validate_paper_compiled().
+
+    Results are cached until the file changes; a missing or unparsable config
+    yields no rules.
+    """
+    path = os.path.abspath(config_path)
+    try:
+        st = os.stat(path)
+        return _load_config_cached(path, st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError):
+        # Missing or unparsable config (e.g. half-written by an editor): no rules.
+        # Failures are not cached, so the next call tries again.
+        return _NO_RULES
+
+
+def _get_response_values(responses: Dict[str, Any], question: str, attribute: str) -> List[str]:
     q = responses.get(question, {})
     vals = q.get(attribute, [])
     if not isinstance(vals, list):
@@ -49,8 +108,7 @@ def _get_response_values(paper_entry: Dict[str, Any], question: str, attribute:
     return vals
 
 
-def _get_toggle_enabled(paper_entry: Dict[str, Any], question: str, attribute: str) -> bool:
-    toggles = paper_entry.get('toggle_states', {})
+def _get_toggle_enabled(toggles: Dict[str, Any], question: str, attribute: str) -> bool:
     q = toggles.get(question, {})
     a = q.get(attribute, {})
     if isinstance(a, dict):
@@ -59,143 +117,229 @@ def _get_toggle_enabled(paper_entry: Dict[str, Any], question: str, attribute: s
     return False
 
 
-def _matches_value_in_list(values: List[str], expected: Any) -> bool:
-    """Return True if expected matches any entry in values.
+# Byte-level lookup table for ASCII text: lowercases letters, keeps digits and
+# whitespace, and maps every other character to a space.
+_ASCII_TABLE = bytes(
+    ord(chr(c).lower()) if c < 0x80 and (chr(c).isalnum() or chr(c).isspace()) else 0x20
+    for c in range(256)
+)
 
-    Matching allows exact string match or entries with prefixes like "Other: ..." or "Discussion needed: ...".
-    For example, expected=="Other" will match "Other: foo".
-    """
-    # Booleans are not matched here
-    if isinstance(expected, bool):
-        return False
 
-    def _normalize_text(s: str) -> str:
-        # Lowercase, strip whitespace, replace common punctuation with space
-        return ''.join(ch.lower() if ch.isalnum() or ch.isspace() else ' ' for ch in s).strip()
+# Prefix of a "Prefix: detail" value, i.e. everything before the first ':'.
+_PREFIX_RE = re.compile(r'\A([^:]*):')
 
-    norm_expected = None
-    if isinstance(expected, str):
-        norm_expected = _normalize_text(expected)
 
-    for v in values:
-        # Exact match for non-strings (unlikely) or string compare
-        if v == expected:
-            return True
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(s: str) -> str:
+    # Lowercase, strip whitespace, replace common punctuation with space
+    if s.isascii():
+        return s.encode('ascii').translate(_ASCII_TABLE).decode('ascii').strip()
+    return ''.join(ch.lower() if ch.isalnum() or ch.isspace() else ' ' for ch in s).strip()
+
 
+def _build_norm_index(values: List[Any]) -> NormIndex:
+    norms = set()
+    prefixes = set()
+    for v in values:
         if isinstance(v, str):
-            # If v is in "Prefix: detail" form, compare the prefix too
-            if ':' in v:
-                prefix, _rest = v.split(':', 1)
-                if norm_expected is not None and _normalize_text(prefix) == norm_expected:
-                    return True
+            norms.add(_normalize_text(v))
+            m = _PREFIX_RE.match(v)
+            if m:
+                prefixes.add(_normalize_text(m.group(1)))
+    return frozenset(norms), frozenset(prefixes)
+
+
+def _get_norm_index(responses: Dict[str, Any], question: str, attribute: str, cache: NormCache) -> NormIndex:
+    """Return the NormIndex for (question, attribute), building it at most once per cache."""
+    key = (question, attribute)
+    index = cache.get(key)
+    if index is None:
+        index = cache[key] = _build_norm_index(_get_response_values(responses, question, attribute))
+    return index
+
+
+def _compile_expected(src: str, expected: Any) -> Any:
+    """Return the form of expected that _field_matches compares against."""
+    if src == 'toggle':
+        return bool(expected)
+    if isinstance(expected, str):
+        return _normalize_text(expected)
+    return expected
 
-            # Normalize both sides and compare
-            if norm_expected is not None and _normalize_text(v) == norm_expected:
-                return True
 
-    return False
+def _field_matches(key: FieldKey, expected: Any, responses: Dict[str, Any], toggles: Dict[str, Any],
+                   cache: NormCache) -> bool:
+    src, q, a = key
+    if src == 'toggle':
+        return _get_toggle_enabled(toggles, q, a) == expected
+    if isinstance(expected, str):
+        # Any string that equals expected also normalizes to it, so one set
+        # lookup covers both the exact and the normalized comparison.
+        norms, prefixes = _get_norm_index(responses, q, a, cache)
+        return expected in norms or expected in prefixes
+    # Booleans never match response values; other non-strings need an exact match
+    return not isinstance(expected, bool) and expected in _get_response_values(responses, q, a)
 
 
-def validate_paper(paper_entry: Dict[str, Any], config_path: str = 'sanity_checks.json') -> List[str]:
-    """Validate a single paper export entry against rules in config_path.
+def _compile_rules(rules: Iterable[Dict[str, Any]]) -> CompiledRules:
+    """Flatten config rules into parallel columns and bucket their ids by trigger field.
 
-    Returns a list of human-readable violation messages (empty when all pass).
+    Rules that can never produce a violation (missing question/attribute, no
+    supported operator) are dropped here instead of being skipped on every call.
     """
-    rules = _load_config(config_path)
-    violations: List[str] = []
+    by_trigger: Dict[FieldKey, List[int]] = {}
+    untriggered: List[int] = []
+    trigger_keys: List[FieldKey] = []
+    trigger_expected: List[Any] = []
+    target_keys: List[FieldKey] = []
+    target_expected: List[Any] = []
+    negate: List[bool] = []
+    messages: List[str] = []
 
     for rule in rules:
         when = rule.get('when', {})
         then = rule.get('then', {})
-        message = rule.get('message', None)
+        q, a, equals = when.get('question'), when.get('attribute'), when.get('equals', _MISSING)
+        t_q, t_a = then.get('question'), then.get('attribute')
+        if q is None or a is None or equals is _MISSING:
+            continue
+        if t_q is None or t_a is None:
+            continue
+        if 'must_equal' in then:
+            expected, negated = then['must_equal'], False
+        elif 'must_not_equal' in then:
+            expected, negated = then['must_not_equal'], True
+        else:
+            continue
 
-        # Evaluate `when` condition
-        src = when.get('source', 'response')
-        q = when.get('question')
-        a = when.get('attribute')
-
-        if src == 'toggle':
-            if q is None or a is None:
-                continue
-            actual = _get_toggle_enabled(paper_entry, q, a)
-            # 'equals' can be boolean
-            if 'equals' in when:
-                expected = bool(when['equals'])
-                condition_met = (actual == expected)
-            else:
-                # no supported operator -> skip
-                condition_met = False
-        else:  # response (default)
-            if q is None or a is None:
-                continue
-            values = _get_response_values(paper_entry, q, a)
-            if 'equals' in when:
-                expected = when['equals']
-                condition_met = _matches_value_in_list(values, expected)
-            else:
-                condition_met = False
-
-        if not condition_met:
-            # when not met -> rule not applicable
+        src = 'toggle' if when.get('source', 'response') == 'toggle' else 'response'
+        t_src = 'toggle' if then.get('source', 'response') == 'toggle' else 'response'
+        # A boolean never matches response values: such a `when` is never met
+        # and such a must_not_equal never fails
+        if isinstance(equals, bool) and src == 'response':
+            continue
+        if isinstance(expected, bool) and t_src == 'response' and negated:
             continue
 
-        # Evaluate `then` assertions
-        t_src = then.get('source', 'response')
-        t_q = then.get('question')
-        t_a = then.get('attribute')
-
-        if t_src == 'toggle':
-            if t_q is None or t_a is None:
-                continue
-            actual = _get_toggle_enabled(paper_entry, t_q, t_a)
-            if 'must_equal' in then:
-                expected = bool(then['must_equal'])
-                ok = (actual == expected)
-            elif 'must_not_equal' in then:
-                expected = bool(then['must_not_equal'])
-                ok = (actual != expected)
-            else:
-                ok = True
+        message = rule.get('message', None)
+        if not message:
+            message = f"Rule '{rule.get('id', '<unknown>')}' violated"
+
+        rule_id = len(messages)
+        trigger_keys.append((src, q, a))
+        trigger_expected.append(_compile_expected(src, equals))
+        target_keys.append((t_src, t_q, t_a))
+        target_expected.append(_compile_expected(t_src, expected))
+        negate.append(negated)
+        messages.append(message)
+
+        if src == 'toggle' and not trigger_expected[rule_id]:
+            # An absent toggle counts as disabled, so `equals: false` can fire
+            # without the field being present.
+            untriggered.append(rule_id)
         else:
-            if t_q is None or t_a is None:
-                continue
-            target_values = _get_response_values(paper_entry, t_q, t_a)
-            if 'must_equal' in then:
-                expected = then['must_equal']
-                ok = _matches_value_in_list(target_values, expected)
-            elif 'must_not_equal' in then:
-                expected = then['must_not_equal']
-                ok = not _matches_value_in_list(target_values, expected)
-            else:
-                ok = True
-
-        if not ok:
-            if message:
-                violations.append(message)
-            else:
-                violations.append(f"Rule '{rule.get('id', '<unknown>')}' violated")
-
+            # Absent responses never match, so the field must be present
+            by_trigger.setdefault(trigger_keys[rule_id], []).append(rule_id)
+
+    return CompiledRules(
+        {key: tuple(ids) for key, ids in by_trigger.items()}, tuple(untriggered),
+        tuple(trigger_keys), tuple(trigger_expected), tuple(target_keys), tuple(target_expected),
+        tuple(negate), tuple(messages),
+    )
+
+
+def _triggered_rules(responses: Dict[str, Any], toggles: Dict[str, Any], rules: CompiledRules) -> List[int]:
+    """Return the ids of rules whose trigger field is present in the paper, in config order."""
+    by_trigger = rules.by_trigger
+    candidates = list(rules.untriggered)
+    for src, fields in (('response', responses), ('toggle', toggles)):
+        for q, attrs in fields.items():
+            if isinstance(attrs, dict):
+                for a in attrs:
+                    candidates.extend(by_trigger.get((src, q, a), ()))
+    candidates.sort()
+    return candidates
+
+
+def validate_paper_compiled(paper_entry: Dict[str, Any], rules: CompiledRules,
+                            short_circuit: bool = False) -> List[str]:
+    """Validate a single paper export entry against already compiled rules.
+
+    Use this with load_rules() to validate many papers without re-checking the
+    config file for each one. See validate_paper() for `short_circuit`.
+    """
+    # Exports may carry null for either section; treat it like an absent one
+    responses = paper_entry.get('responses') or {}
+    toggles = paper_entry.get('toggle_states') or {}
+    violations: List[str] = []
+    # Normalized response values, shared by every rule that reads the same field
+    cache: NormCache = {}
+
+    trigger_keys = rules.trigger_keys
+    trigger_expected = rules.trigger_expected
+    target_keys = rules.target_keys
+    target_expected = rules.target_expected
+    negate = rules.negate
+    messages = rules.messages
+    # Rules sharing a message are reported once; skip them once it is reported
+    seen = set()
+    for i in _triggered_rules(responses, toggles, rules):
+        message = messages[i]
+        if message in seen:
+            continue
+        if not _field_matches(trigger_keys[i], trigger_expected[i], responses, toggles, cache):
+            continue
+        # must_equal holds when the target matches, must_not_equal when it doesn't
+        if _field_matches(target_keys[i], target_expected[i], responses, toggles, cache) == negate[i]:
+            seen.add(message)
+            violations.append(message)
+            if short_circuit:
+                break
     return violations
 
 
+def validate_paper(paper_entry: Dict[str, Any], config_path: str = 'sanity_checks.json',
+                   short_circuit: bool = False) -> List[str]:
+    """Validate a single paper export entry against rules in config_path.
+
+    Returns a list of human-readable violation messages (empty when all pass).
+    Each message appears at most once, even if several rules share it. With
+    `short_circuit`, stops at the first violation, for callers that only need
+    to know whether the paper is valid.
+    """
+    return validate_paper_compiled(paper_entry, load_rules(config_path), short_circuit)
+
+
 if __name__ == '__main__':
-    # Simple manual test helper
+    # Simple manual test helper; the paper path may be a glob to check many files
+    import glob
     import sys
     if len(sys.argv) < 2:
-        print('Usage: sanity_checks.py <exported_paper_json> [config.json]')
+        print('Usage: sanity_checks.py <exported_paper_json | "glob"> [config.json]')
         sys.exit(2)
-    paper_path = sys.argv[1]
+    paper_pattern = sys.argv[1]
     cfg = sys.argv[2] if len(sys.argv) > 2 else 'sanity_checks.json'
-    try:
-        with open(paper_path, 'r') as f:
-            paper = json.load(f)
-    except Exception as e:
-        print('Error loading paper file:', e)
-        sys.exit(2)
-    v = validate_paper(paper, cfg)
-    if v:
-        print('Violations:')
-        for vv in v:
-            print('-', vv)
-        sys.exit(1)
-    print('No violations')
+    paper_paths = sorted(glob.glob(paper_pattern)) or [paper_pattern]
+    batch = len(paper_paths) > 1
+
+    # Load the config once for the whole batch
+    rules = load_rules(cfg)
+    status = 0
+    for paper_path in paper_paths:
+        label = f'{paper_path}: ' if batch else ''
+        try:
+            with open(paper_path, 'rb') as f:
+                paper = _loads(f.read())
+        except Exception as e:
+            print(f'{label}Error loading paper file:', e)
+            status = 2
+            continue
+        v = validate_paper_compiled(paper, rules)
+        if v:
+            print(f'{label}Violations:')
+            for vv in v:
+                print('-', vv)
+            status = max(status, 1)
+        else:
+            print(f'{label}No violations')
+    sys.exit(status)
@@ -0,0 +1,17 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# Make the top-level modules (e.g. sanity_checks) importable under plain `pytest`
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def data_items():
+    """Parsed data-items.json, read once per test session."""
+    return json.loads((ROOT / "data-items.json").read_bytes())
@@ -0,0 +1,33 @@
+"""
+Tests for verifying the multiple selection functionality.
+"""
+
+
+def test_type_of_evaluation_has_multiple_marker(data_items):
+    # Check if the "Type of evaluation" attribute has "Multiple" marker
+    evaluation_section = data_items.get("Evaluation (RQ5)", {})
+    type_of_evaluation = evaluation_section.get("Type of evaluation", [])
+
+    assert "Multiple" in type_of_evaluation
+
+
+def test_multiple_selection_logic(data_items):
+    type_of_evaluation = data_items["Evaluation (RQ5)"]["Type of evaluation"]
+
+    # Simulate the behavior; selections are an insertion-ordered set (dict keys)
+    selected_values = {}
+
+    # Test adding values, including a duplicate
+    test_values = ["Technical (Benchmark), Quantitative", "User study, Qualitative",
+                   "Technical (Benchmark), Quantitative"]
+    for value in test_values:
+        assert value in type_of_evaluation
+        selected_values[value] = None
+
+    assert list(selected_values) == ["Technical (Benchmark), Quantitative", "User study, Qualitative"]
+
+    # Test removing a value, and removing it again
+    selected_values.pop("Technical (Benchmark), Quantitative", None)
+    selected_values.pop("Technical (Benchmark), Quantitative", None)
+
+    assert list(selected_values) == ["User study, Qualitative"]
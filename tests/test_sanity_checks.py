@@ -0,0 +1,302 @@
+"""
+Tests for the sanity checks validator.
+"""
+
+import json
+import os
+import pathlib
+import random
+import subprocess
+import sys
+
+import sanity_checks
+
+CODE = ("General information", "Code available?")
+STATE = ("Evaluation (RQ5)", "State of explainability")
+
+
+def _rule(rule_id, when, then, message=None):
+    rule = {
+        "id": rule_id,
+        "when": {"source": "response", "question": when[0], "attribute": when[1], "equals": when[2]},
+        "then": {"source": "response", "question": then[0], "attribute": then[1], then[2]: then[3]},
+    }
+    if message is not None:
+        rule["message"] = message
+    return rule
+
+
+def _write_config(path, rules):
+    path.write_text(json.dumps(rules))
+    return str(path)
+
+
+def _paper(code, state):
+    return {"responses": {CODE[0]: {CODE[1]: [code]}, STATE[0]: {STATE[1]: [state]}}}
+
+
+def test_config_edits_take_effect(tmp_path):
+    cfg = tmp_path / "rules.json"
+    _write_config(cfg, [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "first")])
+    paper = _paper("no", "Evaluated")
+    assert sanity_checks.validate_paper(paper, str(cfg)) == ["first"]
+
+    st = os.stat(cfg)
+    _write_config(cfg, [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "second")])
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sanity_checks.validate_paper(paper, str(cfg)) == ["second"]
+
+    # An edit within the mtime resolution is still picked up through the size
+    st = os.stat(cfg)
+    _write_config(cfg, [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "third edit")])
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert sanity_checks.validate_paper(paper, str(cfg)) == ["third edit"]
+
+
+def test_unparsable_config_is_not_cached(tmp_path):
+    cfg = tmp_path / "rules.json"
+    cfg.write_text('[{"id": "half-written"')
+    paper = _paper("no", "Evaluated")
+    assert sanity_checks.validate_paper(paper, str(cfg)) == []
+
+    st = os.stat(cfg)
+    _write_config(cfg, [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "done")])
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert sanity_checks.validate_paper(paper, str(cfg)) == ["done"]
+
+
+def test_relative_config_path_follows_cwd(tmp_path, monkeypatch):
+    paper = _paper("no", "Evaluated")
+    configs = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        configs.append(_write_config(
+            tmp_path / name / "sanity_checks.json",
+            [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), name)],
+        ))
+    # Same size and mtime, so only the directory tells the two files apart
+    st = os.stat(configs[0])
+    os.utime(configs[1], ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    for name in ("a", "b"):
+        monkeypatch.chdir(tmp_path / name)
+        assert sanity_checks.validate_paper(paper, "sanity_checks.json") == [name]
+
+
+def _toggle_rule(rule_id, equals, then, message):
+    rule = _rule(rule_id, (*CODE, None), then, message)
+    rule["when"] = {"source": "toggle", "question": CODE[0], "attribute": CODE[1], "equals": equals}
+    return rule
+
+
+def test_toggle_equals_false_fires_when_toggle_absent(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json",
+                        [_toggle_rule("t", False, (*STATE, "must_equal", "Pseudo-code"), "off")])
+    paper = {"responses": {STATE[0]: {STATE[1]: ["Evaluated"]}}}
+    assert sanity_checks.validate_paper(paper, cfg) == ["off"]
+
+    paper["toggle_states"] = {CODE[0]: {CODE[1]: {"enabled": True}}}
+    assert sanity_checks.validate_paper(paper, cfg) == []
+
+
+def test_legacy_bool_toggle_counts_as_disabled(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _toggle_rule("off", False, (*STATE, "must_equal", "Pseudo-code"), "off"),
+        _toggle_rule("on", True, (*STATE, "must_equal", "Pseudo-code"), "on"),
+    ])
+    paper = {"responses": {STATE[0]: {STATE[1]: ["Evaluated"]}},
+             "toggle_states": {CODE[0]: {CODE[1]: True}}}
+    assert sanity_checks.validate_paper(paper, cfg) == ["off"]
+
+
+def test_rule_on_absent_response_never_fires(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "code"),
+    ])
+    assert sanity_checks.validate_paper({"responses": {STATE[0]: {STATE[1]: ["Evaluated"]}}}, cfg) == []
+    assert sanity_checks.validate_paper({"responses": {CODE[0]: {}}}, cfg) == []
+    assert sanity_checks.validate_paper({}, cfg) == []
+
+
+def test_null_sections_are_treated_as_absent(tmp_path):
+    assert sanity_checks.validate_paper({"toggle_states": None}) == []
+    assert sanity_checks.validate_paper({"responses": None}, str(tmp_path / "missing.json")) == []
+
+    cfg = _write_config(tmp_path / "rules.json",
+                        [_toggle_rule("t", False, (*STATE, "must_equal", "Pseudo-code"), "off")])
+    paper = {"responses": {STATE[0]: {STATE[1]: ["Evaluated"]}}, "toggle_states": None}
+    assert sanity_checks.validate_paper(paper, cfg) == ["off"]
+
+
+def test_violations_follow_config_order(tmp_path):
+    # The paper lists the code field first; the config triggers on state first
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("state", (*STATE, "Evaluated"), (*CODE, "must_equal", "yes"), "state"),
+        _rule("code", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "code"),
+    ])
+    assert sanity_checks.validate_paper(_paper("no", "Evaluated"), cfg) == ["state", "code"]
+
+
+def test_cli_batch_over_glob(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json",
+                        [_rule("r", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "needs pseudo-code")])
+    papers = tmp_path / "papers"
+    papers.mkdir()
+    (papers / "a_clean.json").write_text(json.dumps(_paper("no", "Pseudo-code")))
+    (papers / "b_violating.json").write_text(json.dumps(_paper("no", "Evaluated")))
+    (papers / "c_broken.json").write_text("{not json")
+
+    result = subprocess.run(
+        [sys.executable, sanity_checks.__file__, str(papers / "*.json"), cfg],
+        capture_output=True, text=True,
+    )
+
+    assert result.returncode == 2
+    lines = result.stdout.splitlines()
+    assert lines[0] == f"{papers / 'a_clean.json'}: No violations"
+    assert lines[1] == f"{papers / 'b_violating.json'}: Violations:"
+    assert lines[2] == "- needs pseudo-code"
+    assert lines[3].startswith(f"{papers / 'c_broken.json'}: Error loading paper file:")
+
+
+def test_shared_message_is_reported_once(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("r1", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "shared"),
+        _rule("r2", (*CODE, "no"), (*STATE, "must_not_equal", "Evaluated"), "shared"),
+    ])
+    assert sanity_checks.validate_paper(_paper("no", "Evaluated"), cfg) == ["shared"]
+
+
+def test_unique_messages_keep_config_order(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("r1", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "first"),
+        _rule("r2", (*CODE, "no"), (*STATE, "must_not_equal", "Evaluated"), "second"),
+        _rule("r3", (*CODE, "no"), (*STATE, "must_equal", "Not applicable"), "third"),
+    ])
+    assert sanity_checks.validate_paper(_paper("no", "Evaluated"), cfg) == ["first", "second", "third"]
+
+
+def test_short_circuit_returns_first_violation(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("r1", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), "first"),
+        _rule("r2", (*CODE, "no"), (*STATE, "must_not_equal", "Evaluated"), "second"),
+    ])
+    assert sanity_checks.validate_paper(_paper("no", "Evaluated"), cfg, short_circuit=True) == ["first"]
+    assert sanity_checks.validate_paper(_paper("no", "Pseudo-code"), cfg, short_circuit=True) == []
+
+
+def test_empty_message_falls_back_to_rule_id(tmp_path):
+    cfg = _write_config(tmp_path / "rules.json", [
+        _rule("no_message", (*CODE, "no"), (*STATE, "must_equal", "Pseudo-code"), ""),
+        _rule("missing_message", (*CODE, "no"), (*STATE, "must_not_equal", "Evaluated")),
+    ])
+    assert sanity_checks.validate_paper(_paper("no", "Evaluated"), cfg) == [
+        "Rule 'no_message' violated",
+        "Rule 'missing_message' violated",
+    ]
+
+
+def _reference_validate(paper_entry, rules):
+    """The original, uncompiled validator, with repeated messages dropped."""
+
+    def normalize(s):
+        return ''.join(ch.lower() if ch.isalnum() or ch.isspace() else ' ' for ch in s).strip()
+
+    def matches(values, expected):
+        if isinstance(expected, bool):
+            return False
+        norm_expected = normalize(expected) if isinstance(expected, str) else None
+        for v in values:
+            if v == expected:
+                return True
+            if isinstance(v, str) and norm_expected is not None:
+                if ':' in v and normalize(v.split(':', 1)[0]) == norm_expected:
+                    return True
+                if normalize(v) == norm_expected:
+                    return True
+        return False
+
+    def response(q, a):
+        vals = paper_entry.get('responses', {}).get(q, {}).get(a, [])
+        return vals if isinstance(vals, list) else []
+
+    def toggle(q, a):
+        val = paper_entry.get('toggle_states', {}).get(q, {}).get(a, {})
+        return bool(val.get('enabled', False)) if isinstance(val, dict) else False
+
+    violations = []
+    for rule in rules:
+        when, then = rule.get('when', {}), rule.get('then', {})
+        q, a = when.get('question'), when.get('attribute')
+        if q is None or a is None or 'equals' not in when:
+            continue
+        if when.get('source', 'response') == 'toggle':
+            met = toggle(q, a) == bool(when['equals'])
+        else:
+            met = matches(response(q, a), when['equals'])
+        if not met:
+            continue
+        t_q, t_a = then.get('question'), then.get('attribute')
+        if t_q is None or t_a is None:
+            continue
+        if then.get('source', 'response') == 'toggle':
+            actual = toggle(t_q, t_a)
+            if 'must_equal' in then:
+                ok = actual == bool(then['must_equal'])
+            elif 'must_not_equal' in then:
+                ok = actual != bool(then['must_not_equal'])
+            else:
+                ok = True
+        else:
+            if 'must_equal' in then:
+                ok = matches(response(t_q, t_a), then['must_equal'])
+            elif 'must_not_equal' in then:
+                ok = not matches(response(t_q, t_a), then['must_not_equal'])
+            else:
+                ok = True
+        if not ok:
+            message = rule.get('message') or f"Rule '{rule.get('id', '<unknown>')}' violated"
+            if message not in violations:
+                violations.append(message)
+    return violations
+
+
+def test_matches_reference_validator(tmp_path, data_items):
+    rng = random.Random(1404)
+    rules = json.loads((pathlib.Path(sanity_checks.__file__).parent / "sanity_checks.json").read_bytes())
+    rules += [
+        _toggle_rule("toggle_off", False, (*STATE, "must_not_equal", "pseudo code"), "toggle off"),
+        _toggle_rule("toggle_on", True, (*STATE, "must_equal", True), ""),
+        _rule("duplicate", (*CODE, "NO."), (*STATE, "must_equal", "Pseudo-code"), rules[0]["message"]),
+        _rule("non_string", (*CODE, 5), (*STATE, "must_equal", "x"), "non-string"),
+    ]
+    cfg = _write_config(tmp_path / "rules.json", rules)
+
+    def variant(option):
+        r = rng.random()
+        if r < 0.1:
+            return "Other: " + option
+        if r < 0.2:
+            return option.upper() + "."
+        if r < 0.3:
+            return option.replace("-", " ") + ": detail"
+        if r < 0.35:
+            return "Ünïcode–" + option
+        if r < 0.38:
+            return 5
+        return option
+
+    for _ in range(2000):
+        paper = {"responses": {}, "toggle_states": {}}
+        for q, attrs in data_items.items():
+            if rng.random() < 0.1:
+                continue
+            paper["responses"][q] = {}
+            for a, options in attrs.items():
+                options = [o for o in options if o not in ("single-choice", "Multiple")]
+                if rng.random() < 0.9:
+                    paper["responses"][q][a] = [variant(rng.choice(options)) for _ in range(rng.randint(0, 2))]
+                if rng.random() < 0.3:
+                    paper["toggle_states"].setdefault(q, {})[a] = rng.choice(
+                        [{"enabled": True}, {"enabled": False}, True, {}])
+        assert sanity_checks.validate_paper(paper, cfg) == _reference_validate(paper, rules)